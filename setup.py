@@ -24,7 +24,6 @@ setup(
         "Topic :: Software Development :: Libraries :: Python Modules",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -32,15 +31,27 @@ setup(
         "Programming Language :: Python :: 3.11",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     install_requires=[],  # No external dependencies
     extras_require={
+        "fast": [
+            "orjson",
+        ],
+        "hyperscan": [
+            "hyperscan",
+        ],
+        "numba": [
+            "numpy",
+            "numba",
+        ],
         "dev": [
             "pytest",
             "pytest-cov",
             "black",
             "flake8",
             "mypy",
+            "numpy",
+            "numba",
         ],
     },
     include_package_data=True,
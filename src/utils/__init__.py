@@ -4,20 +4,66 @@ Python Utils
 A collection of useful Python utilities for validation, conversion, and common operations.
 """
 
-__version__ = "0.1.0"
+import importlib
 
-# Import main modules for convenience
-from .validation.validators import *
-from .conversion.json_converter import *
+__version__ = "0.1.0"
 
 __all__ = [
     # Validators
     "ValidationError",
     "validate_type", "validate_range", "validate_length", "validate_pattern",
     "validate_email", "validate_url", "validate_ip", "validate_uuid", 
-    "validate_json", "validate_not_empty", "validate_in_options",
+    "validate_json", "validate_not_empty", "validate_in_options", "validate_many",
+    "validate_range_array",
     
     # JSON Converter
     "to_json", "from_json", "json_to_file", "json_from_file", "merge_json",
     "ExtendedJSONEncoder"
-]
\ No newline at end of file
+]
+
+# Public names are imported from their modules on first access (PEP 562), so
+# importing the package alone does not load the validators or JSON converter
+_LAZY_ATTRIBUTES = {
+    # Validators
+    "ValidationError": ".validation.validators",
+    "validate_type": ".validation.validators",
+    "validate_range": ".validation.validators",
+    "validate_length": ".validation.validators",
+    "validate_pattern": ".validation.validators",
+    "validate_email": ".validation.validators",
+    "validate_url": ".validation.validators",
+    "validate_ip": ".validation.validators",
+    "validate_uuid": ".validation.validators",
+    "validate_json": ".validation.validators",
+    "validate_not_empty": ".validation.validators",
+    "validate_in_options": ".validation.validators",
+    "validate_many": ".validation.validators",
+    "validate_range_array": ".validation.validators",
+    
+    # JSON Converter
+    "to_json": ".conversion.json_converter",
+    "from_json": ".conversion.json_converter",
+    "json_to_file": ".conversion.json_converter",
+    "json_from_file": ".conversion.json_converter",
+    "merge_json": ".conversion.json_converter",
+    "ExtendedJSONEncoder": ".conversion.json_converter",
+}
+
+_SUBPACKAGES = ("validation", "conversion")
+
+
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f".{name}", __name__)
+        
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
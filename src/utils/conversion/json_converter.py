@@ -2,23 +2,56 @@
 JSON conversion utilities with extended type support.
 
 Handles conversion of datetime, UUID, Decimal, and custom objects to/from JSON.
+Uses orjson for encoding and decoding when it is installed, falling back to the
+standard library json module otherwise.
 """
 
 import json
+import math
 import datetime
 import uuid
 import decimal
 from typing import Any, Dict, List, Optional, Union, Type, TypeVar, Set, Callable
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 T = TypeVar('T')
 
+# orjson decodes integers outside the 64-bit range as floats; documents with a
+# run of 19+ digits may contain one and are parsed by the stdlib instead. The
+# run is found by mapping every digit to b'0' (translate is much faster than re)
+_DIGITS_TO_ZERO = bytes(b if not 0x30 <= b <= 0x39 else 0x30 for b in range(256))
+_LONG_DIGIT_RUN = b'0' * 19
+
+# Buffer size for file I/O; large documents are read and written in few syscalls
+_FILE_BUFFER_SIZE = 1 << 20
+
 
 class ExtendedJSONEncoder(json.JSONEncoder):
     """JSON encoder that handles additional types like datetime, UUID, Decimal, etc."""
     
+    # Converters keyed by exact type; subclasses fall through to the isinstance checks
+    _ENCODERS = {
+        datetime.datetime: datetime.datetime.isoformat,
+        datetime.date: datetime.date.isoformat,
+        datetime.time: datetime.time.isoformat,
+        datetime.timedelta: str,
+        uuid.UUID: str,
+        decimal.Decimal: float,
+        set: list,
+        frozenset: list,
+    }
+    
     def default(self, obj):
         """Convert non-standard types to JSON-serializable types."""
+        encoder = self._ENCODERS.get(type(obj))
+        if encoder is not None:
+            return encoder(obj)
+            
         if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
             return obj.isoformat()
         elif isinstance(obj, datetime.timedelta):
@@ -27,7 +60,7 @@ class ExtendedJSONEncoder(json.JSONEncoder):
             return str(obj)
         elif isinstance(obj, decimal.Decimal):
             return float(obj)
-        elif isinstance(obj, set):
+        elif isinstance(obj, (set, frozenset)):
             return list(obj)
         elif hasattr(obj, 'to_json'):
             return obj.to_json()
@@ -36,25 +69,115 @@ class ExtendedJSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+# Shared encoder instance whose default() is reused as orjson's default hook
+_default_encoder = ExtendedJSONEncoder()
+
+
+def _may_contain_non_finite(data: Any) -> bool:
+    """
+    Check whether data may contain NaN or infinite floats.
+    
+    Only plain JSON containers are walked; values of other types are converted
+    by ExtendedJSONEncoder.default and are conservatively reported as suspect.
+    """
+    stack = [data]
+    pop = stack.pop
+    extend = stack.extend
+    
+    while stack:
+        value = pop()
+        value_type = type(value)
+        if value_type is float:
+            if not math.isfinite(value):
+                return True
+        elif value_type is dict:
+            extend(value.values())
+        elif value_type is list or value_type is tuple:
+            extend(value)
+        elif value is not None and value_type not in (str, int, bool):
+            return True
+            
+    return False
+
+
+def _orjson_dumps(data: Any, pretty: bool, ensure_ascii: bool, sort_keys: bool) -> Optional[bytes]:
+    """
+    Serialize data with orjson if possible.
+    
+    Returns None when orjson is not installed, when the data contains values
+    orjson cannot encode (e.g. integers wider than 64 bits) or encodes
+    differently from the stdlib (NaN/Infinity), or when ASCII output was
+    requested but the result contains non-ASCII characters. Callers should
+    fall back to the standard library encoder in that case.
+    """
+    if orjson is None:
+        return None
+        
+    # Dataclasses go through default() so that to_json() hooks still apply
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATACLASS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+        
+    try:
+        result = orjson.dumps(data, default=_default_encoder.default, option=option)
+    except orjson.JSONEncodeError:
+        return None
+        
+    # orjson never escapes non-ASCII characters
+    if ensure_ascii and not result.isascii():
+        return None
+        
+    # orjson writes NaN/Infinity as null, where the stdlib writes NaN/Infinity
+    if b"null" in result and _may_contain_non_finite(data):
+        return None
+        
+    return result
+
+
+def _loads(json_str: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Parse a JSON document, preferring orjson when it is installed."""
+    if isinstance(json_str, memoryview):
+        json_str = json_str.tobytes()
+        
+    if orjson is not None:
+        raw = json_str.encode('utf-8', 'surrogatepass') if isinstance(json_str, str) else json_str
+        if _LONG_DIGIT_RUN not in raw.translate(_DIGITS_TO_ZERO):
+            try:
+                return orjson.loads(json_str)
+            except orjson.JSONDecodeError:
+                # Let the stdlib decide: it accepts NaN/Infinity and reports the error
+                pass
+                
+    return json.loads(json_str)
+
+
 def to_json(
     data: Any, 
     pretty: bool = False, 
     ensure_ascii: bool = True,
     sort_keys: bool = False,
-    custom_encoder: Optional[Type[json.JSONEncoder]] = None
-) -> str:
+    custom_encoder: Optional[Type[json.JSONEncoder]] = None,
+    as_bytes: bool = False
+) -> Union[str, bytes]:
     """
     Convert any Python object to JSON string.
     
     Args:
         data: Data to convert (dict, list, object, etc.)
         pretty: Whether to format the JSON for readability
-        ensure_ascii: Whether to escape non-ASCII characters
+        ensure_ascii: Whether to escape non-ASCII characters. orjson can't
+            escape them, so non-ASCII data is encoded twice (once by orjson,
+            once by the standard library); pass False to avoid this
         sort_keys: Whether to sort dictionary keys
-        custom_encoder: Custom JSON encoder class
+        custom_encoder: Custom JSON encoder class (disables the orjson fast path)
+        as_bytes: Whether to return UTF-8 encoded bytes instead of a string,
+            which skips decoding the orjson output
         
     Returns:
-        JSON string
+        JSON string (or bytes if as_bytes=True). Compact output has no spaces
+        after separators, whichever backend produced it.
         
     Example:
         >>> to_json({"name": "John", "age": 30}, pretty=True)
@@ -66,20 +189,28 @@ def to_json(
         >>> to_json(datetime.datetime.now())
         "2025-01-01T12:00:00.000000"
     """
+    if custom_encoder is None:
+        result = _orjson_dumps(data, pretty, ensure_ascii, sort_keys)
+        if result is not None:
+            return result if as_bytes else result.decode('utf-8')
+            
     indent = 2 if pretty else None
+    separators = None if pretty else (',', ':')
     encoder_class = custom_encoder or ExtendedJSONEncoder
     
-    return json.dumps(
+    result = json.dumps(
         data,
         indent=indent,
+        separators=separators,
         ensure_ascii=ensure_ascii,
         sort_keys=sort_keys,
         cls=encoder_class
     )
+    return result.encode('utf-8') if as_bytes else result
 
 
 def from_json(
-    json_str: str,
+    json_str: Union[str, bytes, bytearray, memoryview],
     target_type: Optional[Type[T]] = None,
     strict: bool = False
 ) -> Union[T, Dict, List]:
@@ -87,7 +218,8 @@ def from_json(
     Convert JSON string to Python object.
     
     Args:
-        json_str: JSON string to parse
+        json_str: JSON string to parse, or UTF-8 encoded bytes-like object
+            (parsed directly without decoding to str first)
         target_type: Optional type to convert to
         strict: Whether to raise exception on error
         
@@ -95,7 +227,7 @@ def from_json(
         Parsed object (dict/list by default, or instance of target_type)
         
     Raises:
-        ValueError: If JSON is invalid and strict=True
+        ValueError: If JSON (or its UTF-8 encoding) is invalid and strict=True
         
     Example:
         >>> from_json('{"name": "John", "age": 30}')
@@ -109,8 +241,8 @@ def from_json(
         <Person object>
     """
     try:
-        data = json.loads(json_str)
-    except json.JSONDecodeError as e:
+        data = _loads(json_str)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         if strict:
             raise ValueError(f"Invalid JSON: {str(e)}") from e
         return {} if target_type in (dict, None) else []
@@ -127,6 +259,8 @@ def from_json(
     try:
         # Check for custom deserialization methods
         if hasattr(target_type, 'from_json'):
+            if not isinstance(json_str, str):
+                json_str = bytes(json_str).decode('utf-8')
             return target_type.from_json(json_str)
         elif hasattr(target_type, 'from_dict') and isinstance(data, dict):
             return target_type.from_dict(data)
@@ -160,21 +294,18 @@ def json_to_file(
         data: Data to write
         filepath: Path to output file
         pretty: Whether to format the JSON
-        ensure_ascii: Whether to escape non-ASCII characters
+        ensure_ascii: Whether to escape non-ASCII characters. orjson can't
+            escape them, so non-ASCII data is encoded twice (once by orjson,
+            once by the standard library); pass False to avoid this
         sort_keys: Whether to sort dictionary keys
         
     Example:
         >>> json_to_file({"name": "John"}, "person.json")
     """
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(
-            data,
-            f,
-            indent=2 if pretty else None,
-            ensure_ascii=ensure_ascii,
-            sort_keys=sort_keys,
-            cls=ExtendedJSONEncoder
-        )
+    content = to_json(data, pretty=pretty, ensure_ascii=ensure_ascii, sort_keys=sort_keys, as_bytes=True)
+    
+    with open(filepath, 'wb', buffering=_FILE_BUFFER_SIZE) as f:
+        f.write(content)
 
 
 def json_from_file(
@@ -198,7 +329,8 @@ def json_from_file(
         {'name': 'John', 'age': 30}
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        # Read raw bytes; both orjson and json.loads parse UTF-8 bytes directly
+        with open(filepath, 'rb', buffering=_FILE_BUFFER_SIZE) as f:
             content = f.read()
         return from_json(content, target_type, strict)
     except Exception as e:
@@ -210,7 +342,8 @@ def json_from_file(
 def merge_json(
     base: Union[str, Dict],
     update: Union[str, Dict],
-    deep: bool = True
+    deep: bool = True,
+    inplace: bool = False
 ) -> Dict:
     """
     Merge two JSON objects.
@@ -219,6 +352,10 @@ def merge_json(
         base: Base JSON string or dict
         update: Update JSON string or dict
         deep: Whether to do deep merge
+        inplace: Whether to merge directly into base (when it is a dict)
+            instead of a copy. The caller's dict is mutated and returned.
+            Otherwise neither input is modified, and nested dicts in a deep
+            merge result are not shared with either input.
         
     Returns:
         Merged dictionary
@@ -231,20 +368,50 @@ def merge_json(
         {'a': {'x': 1, 'y': 2}}
     """
     # Convert to dicts if needed
-    base_dict = from_json(base) if isinstance(base, str) else base.copy()
     update_dict = from_json(update) if isinstance(update, str) else update
     
+    if isinstance(base, str):
+        # Freshly parsed, so it can be merged into directly
+        base_dict = from_json(base)
+    elif inplace:
+        base_dict = base
+    elif not deep:
+        return {**base, **update_dict}
+    else:
+        base_dict = base.copy()
+    
     if not deep:
         base_dict.update(update_dict)
         return base_dict
     
-    # Deep merge
-    def deep_merge(d1, d2):
+    # Unless merging in place, nested dicts owned by the caller are copied before
+    # being merged into, and nested dicts from update are copied into new dicts
+    copy_targets = not inplace and not isinstance(base, str)
+    copy_sources = not inplace and not isinstance(update, str)
+    
+    # Deep merge, using an explicit stack of (target, source) dict pairs
+    _isinstance = isinstance
+    _dict = dict
+    stack = [(base_dict, update_dict)]
+    pop = stack.pop
+    push = stack.append
+    
+    while stack:
+        d1, d2 = pop()
         for key, value in d2.items():
-            if key in d1 and isinstance(d1[key], dict) and isinstance(value, dict):
-                deep_merge(d1[key], value)
+            if not _isinstance(value, _dict):
+                d1[key] = value
+                continue
+                
+            current = d1.get(key)
+            if _isinstance(current, _dict):
+                if copy_targets:
+                    current = d1[key] = _dict(current)
+            elif copy_sources:
+                current = d1[key] = {}
             else:
                 d1[key] = value
-        return d1
-    
-    return deep_merge(base_dict, update_dict)
\ No newline at end of file
+                continue
+            push((current, value))
+            
+    return base_dict
\ No newline at end of file
@@ -6,5 +6,6 @@ __all__ = [
     "ValidationError",
     "validate_type", "validate_range", "validate_length", "validate_pattern",
     "validate_email", "validate_url", "validate_ip", "validate_uuid", 
-    "validate_json", "validate_not_empty", "validate_in_options"
+    "validate_json", "validate_not_empty", "validate_in_options", "validate_many",
+    "validate_range_array"
 ]
\ No newline at end of file
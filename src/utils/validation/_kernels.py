@@ -0,0 +1,57 @@
+"""
+Array kernels for numeric validators.
+
+Imported lazily by the validators module, since it requires NumPy. When Numba
+is installed the kernels are compiled to parallel machine code; otherwise they
+fall back to NumPy array expressions.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _range_mask_numpy(values, min_value, max_value):
+    """Return a boolean mask of the 1-D values within [min_value, max_value]."""
+    return ~((values < min_value) | (values > max_value))
+
+
+if numba is not None:
+    @numba.njit(cache=True, parallel=True)
+    def _range_mask_numba(values, min_value, max_value):
+        """Return a boolean mask of the 1-D values within [min_value, max_value]."""
+        mask = np.empty(values.shape[0], dtype=np.bool_)
+        for i in numba.prange(values.shape[0]):
+            value = values[i]
+            mask[i] = not (value < min_value or value > max_value)
+        return mask
+
+
+# Dtypes the compiled kernel handles; anything else (float16, longdouble,
+# non-native byte order) goes through NumPy
+_NUMBA_DTYPES = frozenset(np.dtype(t) for t in (
+    np.bool_, np.int8, np.int16, np.int32, np.int64,
+    np.uint8, np.uint16, np.uint32, np.uint64, np.float32, np.float64,
+))
+
+
+def _numba_bound(dtype, bound):
+    """Check that Numba compares the bound with the dtype the way NumPy does."""
+    if isinstance(bound, float):
+        return True
+    if isinstance(bound, int):
+        # Numba compares uint64 with signed ints as float64, losing precision
+        return -2 ** 63 <= bound < 2 ** 63 and dtype != np.uint64
+    return False
+
+
+def range_mask(values, min_value, max_value):
+    """Return a boolean mask of the 1-D values within [min_value, max_value]."""
+    dtype = values.dtype
+    if (numba is not None and dtype.isnative and dtype in _NUMBA_DTYPES
+            and _numba_bound(dtype, min_value) and _numba_bound(dtype, max_value)):
+        return _range_mask_numba(values, min_value, max_value)
+    return _range_mask_numpy(values, min_value, max_value)
@@ -7,37 +7,282 @@ All validators raise ValidationError on failure or return True on success.
 
 import re
 import json
+import math
 import ipaddress
+import socket
 import uuid
-from typing import Any, List, Dict, Union, Optional, Pattern, Type, TypeVar, Set, Tuple
+import string
+import functools
+import threading
+import warnings
+from typing import Any, Callable, Iterable, List, Dict, Union, Optional, Pattern, Type, TypeVar, Set, FrozenSet, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 
 T = TypeVar('T')
 
+# Common sized built-in types, checked before falling back to hasattr(value, "__len__")
+_SIZED_TYPES = (str, bytes, bytearray, list, tuple, dict, set, frozenset)
+
+# Use the scan-based email/URL validators instead of the regexes below. The
+# scanners run in guaranteed linear time and bail out early on long malformed
+# input, but for typical short values the compiled regexes are quicker.
+_USE_FAST = False
+
+# Basic email pattern (not RFC compliant but practical)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+
+# Basic URL pattern
+_URL_RE = re.compile(
+    r'^https?://[a-zA-Z0-9][-a-zA-Z0-9.]*\.[a-zA-Z]{2,}(/[-a-zA-Z0-9%_.~#+]*)*(\?[-a-zA-Z0-9%_.~+=&;]*)*\Z'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _hyperscan_database(pattern: Pattern) -> Any:
+    """
+    Compile a whole-value pattern into a Hyperscan database on first use.
+    
+    The database runs in multiline mode so that one scan can check many
+    newline-separated values at once. Returns None if hyperscan is not
+    installed or cannot compile the pattern.
+    """
+    if hyperscan is None:
+        return None
+        
+    expression = pattern.pattern[:-len('\\Z')] + '$'
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[expression.encode('ascii')],
+            ids=[0],
+            elements=1,
+            flags=[hyperscan.HS_FLAG_MULTILINE]
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+# Per-thread Hyperscan scratch space, keyed by database; a scratch can only be
+# used by one scan at a time
+_hyperscan_local = threading.local()
+
+
+def _hyperscan_scratch(database: Any) -> Any:
+    """Return this thread's scratch space for a Hyperscan database."""
+    scratches = getattr(_hyperscan_local, 'scratches', None)
+    if scratches is None:
+        scratches = _hyperscan_local.scratches = {}
+    scratch = scratches.get(database)
+    if scratch is None:
+        scratch = scratches[database] = hyperscan.Scratch(database)
+    return scratch
+
+
+# Character classes used by the patterns above
+_ASCII_ALNUM = string.ascii_letters + string.digits
+_EMAIL_LOCAL_CHARS = _ASCII_ALNUM + '._%+-'
+_HOST_CHARS = _ASCII_ALNUM + '.-'
+_URL_PATH_CHARS = _ASCII_ALNUM + '/-%_.~#+'
+_URL_QUERY_CHARS = _ASCII_ALNUM + '?-%_.~+=&;'
+
+
+def _is_host(host: str) -> bool:
+    """Check for a dotted host name ending in an alphabetic label of 2+ characters."""
+    if host.strip(_HOST_CHARS):
+        return False
+    head, dot, tld = host.rpartition('.')
+    return bool(head) and len(tld) >= 2 and not tld.strip(string.ascii_letters)
+
+
+def _validate_email_fast(value: str) -> bool:
+    """Linear-time equivalent of _EMAIL_RE.match(value)."""
+    local, at, domain = value.partition('@')
+    return bool(local) and bool(at) and not local.strip(_EMAIL_LOCAL_CHARS) and _is_host(domain)
+
+
+def _validate_url_fast(value: str) -> bool:
+    """Linear-time equivalent of _URL_RE.match(value)."""
+    if value.startswith('https://'):
+        rest = value[8:]
+    elif value.startswith('http://'):
+        rest = value[7:]
+    else:
+        return False
+        
+    # Split into host, path and query; the host ends at the first '/' or '?'
+    query_start = rest.find('?')
+    if query_start < 0:
+        query_start = len(rest)
+    path_start = rest.find('/', 0, query_start)
+    if path_start < 0:
+        path_start = query_start
+        
+    host = rest[:path_start]
+    return (
+        _is_host(host)
+        and host[0] != '.' and host[0] != '-'
+        and not rest[path_start:query_start].strip(_URL_PATH_CHARS)
+        and not rest[query_start:].strip(_URL_QUERY_CHARS)
+    )
+
+
+def _parse_ip_version(value: str) -> int:
+    """Return the IP version (4 or 6) of an address string, or 0 if it is invalid."""
+    # Canonical dotted-quad IPv4 addresses are checked in C; anything else
+    # (IPv6, leading zeros, ...) is left to the ipaddress module
+    if value.count('.') == 3:
+        try:
+            if socket.inet_ntoa(socket.inet_pton(socket.AF_INET, value)) == value:
+                return 4
+        except (OSError, ValueError):
+            pass
+            
+    try:
+        return ipaddress.ip_address(value).version
+    except ValueError:
+        return 0
+
+
+_cached_ip_version = functools.lru_cache(maxsize=4096)(_parse_ip_version)
+
+# Longest string whose IP version is cached. Addresses are at most 45
+# characters (plus an IPv6 scope ID), so this keeps arbitrarily long junk
+# input from being pinned in the cache.
+_IP_CACHE_MAX_LEN = 64
+
+
+def _ip_version(value: str) -> int:
+    """Like _parse_ip_version, caching the result for address-sized strings."""
+    if len(value) > _IP_CACHE_MAX_LEN:
+        return _parse_ip_version(value)
+    return _cached_ip_version(value)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str) -> Pattern:
+    """Compile a regex pattern, caching the result for repeated callers."""
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=256)
+def _template_arity(template: str) -> int:
+    """
+    Return the number of positional arguments a str.format template takes,
+    or -1 if it has named fields or is malformed.
+    """
+    auto = 0
+    explicit = 0
+    try:
+        for _, name, spec, _ in string.Formatter().parse(template):
+            if name is None:
+                continue
+            index = re.match(r'[^.\[]*', name).group()
+            if not index:
+                auto += 1
+            elif index.isdigit():
+                explicit = max(explicit, int(index) + 1)
+            else:
+                return -1
+            if spec and '{' in spec:
+                # Nested fields, e.g. '{:>{}}'
+                nested = _template_arity(spec)
+                if nested < 0:
+                    return -1
+                auto += nested
+    except ValueError:
+        return -1
+    return max(auto, explicit)
+
+
+@functools.lru_cache(maxsize=256)
+def _type_names(expected_type: Union[Type, Tuple[Type, ...]]) -> str:
+    """Format a type or tuple of types for error messages, e.g. 'int or float'."""
+    if isinstance(expected_type, tuple):
+        return " or ".join(t.__name__ for t in expected_type)
+    return expected_type.__name__
+
 
 class ValidationError(Exception):
-    """Error raised when validation fails."""
+    """
+    Error raised when validation fails.
     
-    def __init__(self, message: str, field: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
+    The message is given as a str.format template plus arguments and is only
+    formatted when it is read, so errors that are caught and discarded cost
+    no string formatting.
+    """
+    
+    __slots__ = ('template', 'format_args', 'field', 'details')
+    
+    def __init__(
+        self, 
+        template: str, 
+        *args: Any, 
+        field: Optional[str] = None, 
+        details: Optional[Dict[str, Any]] = None
+    ):
         """
         Initialize validation error.
         
         Args:
-            message: Error message
+            template: Error message, or a str.format template if args are given
+            *args: Positional arguments for the template
             field: Field that failed validation
             details: Additional error details
+            
+        The old ValidationError(message, field, details) call shape is still
+        accepted, with a DeprecationWarning, when the positional arguments
+        don't fit the template.
         """
-        self.message = message
+        if (args and len(args) <= 2 and field is None and details is None
+                and isinstance(args[0], (str, type(None)))
+                and (len(args) == 1 or isinstance(args[1], (dict, type(None))))
+                and _template_arity(template) != len(args)):
+            warnings.warn(
+                "Passing field and details to ValidationError positionally is deprecated; "
+                "use the field= and details= keywords",
+                DeprecationWarning,
+                stacklevel=2
+            )
+            field = args[0]
+            details = args[1] if len(args) == 2 else None
+            args = ()
+            
+        self.template = template
+        self.format_args = args
         self.field = field
         self.details = details or {}
         
-        # Format error message
-        formatted_message = message
-        if field:
-            formatted_message = f"Field '{field}': {message}"
-            
-        super().__init__(formatted_message)
+        super().__init__(template, *args)
+        
+    @property
+    def message(self) -> str:
+        """Formatted error message."""
+        if self.format_args:
+            return self.template.format(*self.format_args)
+        return self.template
+        
+    def __str__(self) -> str:
+        if self.field:
+            return f"Field '{self.field}': {self.message}"
+        return self.message
+        
+    def __reduce__(self):
+        # BaseException.__reduce__ only preserves args and __dict__, not slots;
+        # BaseException.__setstate__ restores the keyword-only attributes
+        state = dict(self.__dict__, field=self.field, details=self.details)
+        return (self.__class__, (self.template, *self.format_args), state)
 
 
 # Type validators
@@ -63,14 +308,10 @@ def validate_type(value: Any, expected_type: Union[Type, Tuple[Type, ...]], fiel
         True
     """
     if not isinstance(value, expected_type):
-        type_names = (
-            [t.__name__ for t in expected_type]
-            if isinstance(expected_type, tuple)
-            else [expected_type.__name__]
-        )
-        
         raise ValidationError(
-            f"Expected {' or '.join(type_names)}, got {type(value).__name__}",
+            "Expected {}, got {}",
+            _type_names(expected_type),
+            type(value).__name__,
             field=field
         )
         
@@ -104,13 +345,17 @@ def validate_range(
         True
     """
     if not isinstance(value, (int, float)):
-        raise ValidationError(f"Expected numeric value, got {type(value).__name__}", field=field)
-        
-    if min_value is not None and value < min_value:
-        raise ValidationError(f"Value must be at least {min_value}", field=field)
-        
-    if max_value is not None and value > max_value:
-        raise ValidationError(f"Value must be at most {max_value}", field=field)
+        raise ValidationError("Expected numeric value, got {}", type(value).__name__, field=field)
+        
+    if min_value is not None and max_value is not None:
+        # Not a chained comparison, so NaN still passes as with a single bound
+        if value < min_value or value > max_value:
+            raise ValidationError("Value must be between {} and {}", min_value, max_value, field=field)
+    elif min_value is not None:
+        if value < min_value:
+            raise ValidationError("Value must be at least {}", min_value, field=field)
+    elif max_value is not None and value > max_value:
+        raise ValidationError("Value must be at most {}", max_value, field=field)
         
     return True
 
@@ -141,16 +386,19 @@ def validate_length(
         >>> validate_length("hello", min_length=3, max_length=10)
         True
     """
-    if not hasattr(value, "__len__"):
-        raise ValidationError(f"Expected a value with length, got {type(value).__name__}", field=field)
+    if not isinstance(value, _SIZED_TYPES) and not hasattr(value, "__len__"):
+        raise ValidationError("Expected a value with length, got {}", type(value).__name__, field=field)
         
     length = len(value)
     
-    if min_length is not None and length < min_length:
-        raise ValidationError(f"Length must be at least {min_length}", field=field)
-        
-    if max_length is not None and length > max_length:
-        raise ValidationError(f"Length must be at most {max_length}", field=field)
+    if min_length is not None and max_length is not None:
+        if not min_length <= length <= max_length:
+            raise ValidationError("Length must be between {} and {}", min_length, max_length, field=field)
+    elif min_length is not None:
+        if length < min_length:
+            raise ValidationError("Length must be at least {}", min_length, field=field)
+    elif max_length is not None and length > max_length:
+        raise ValidationError("Length must be at most {}", max_length, field=field)
         
     return True
 
@@ -176,13 +424,13 @@ def validate_pattern(value: str, pattern: Union[str, Pattern], field: Optional[s
         True
     """
     if not isinstance(value, str):
-        raise ValidationError(f"Expected string, got {type(value).__name__}", field=field)
+        raise ValidationError("Expected string, got {}", type(value).__name__, field=field)
         
     if isinstance(pattern, str):
-        pattern = re.compile(pattern)
+        pattern = _compile(pattern)
         
     if not pattern.match(value):
-        raise ValidationError(f"Value does not match pattern", field=field)
+        raise ValidationError("Value does not match pattern", field=field)
         
     return True
 
@@ -207,12 +455,9 @@ def validate_email(value: str, field: Optional[str] = None) -> bool:
         True
     """
     if not isinstance(value, str):
-        raise ValidationError(f"Expected string, got {type(value).__name__}", field=field)
+        raise ValidationError("Expected string, got {}", type(value).__name__, field=field)
         
-    # Basic email pattern (not RFC compliant but practical)
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
-    if not re.match(pattern, value):
+    if not (_validate_email_fast(value) if _USE_FAST else _EMAIL_RE.match(value)):
         raise ValidationError("Invalid email address", field=field)
         
     return True
@@ -239,12 +484,9 @@ def validate_url(value: str, require_https: bool = False, field: Optional[str] =
         True
     """
     if not isinstance(value, str):
-        raise ValidationError(f"Expected string, got {type(value).__name__}", field=field)
+        raise ValidationError("Expected string, got {}", type(value).__name__, field=field)
         
-    # Basic URL pattern
-    pattern = r'^https?://[a-zA-Z0-9][-a-zA-Z0-9.]*\.[a-zA-Z]{2,}(/[-a-zA-Z0-9%_.~#+]*)*(\?[-a-zA-Z0-9%_.~+=&;]*)*$'
-    
-    if not re.match(pattern, value):
+    if not (_validate_url_fast(value) if _USE_FAST else _URL_RE.match(value)):
         raise ValidationError("Invalid URL", field=field)
         
     if require_https and not value.startswith("https://"):
@@ -277,20 +519,19 @@ def validate_ip(value: str, allow_ipv4: bool = True, allow_ipv6: bool = True, fi
         True
     """
     if not isinstance(value, str):
-        raise ValidationError(f"Expected string, got {type(value).__name__}", field=field)
+        raise ValidationError("Expected string, got {}", type(value).__name__, field=field)
         
-    try:
-        ip = ipaddress.ip_address(value)
-        
-        if isinstance(ip, ipaddress.IPv4Address) and not allow_ipv4:
-            raise ValidationError("IPv4 addresses are not allowed", field=field)
-            
-        if isinstance(ip, ipaddress.IPv6Address) and not allow_ipv6:
-            raise ValidationError("IPv6 addresses are not allowed", field=field)
-            
-    except ValueError:
+    version = _ip_version(value)
+    
+    if not version:
         raise ValidationError("Invalid IP address", field=field)
         
+    if version == 4 and not allow_ipv4:
+        raise ValidationError("IPv4 addresses are not allowed", field=field)
+        
+    if version == 6 and not allow_ipv6:
+        raise ValidationError("IPv6 addresses are not allowed", field=field)
+        
     return True
 
 
@@ -314,12 +555,21 @@ def validate_json(value: str, field: Optional[str] = None) -> bool:
         True
     """
     if not isinstance(value, str):
-        raise ValidationError(f"Expected string, got {type(value).__name__}", field=field)
-        
+        raise ValidationError("Expected string, got {}", type(value).__name__, field=field)
+        
+    # orjson parses much faster; on failure the stdlib has the final say, since it
+    # also accepts NaN/Infinity and produces the error message
+    if orjson is not None:
+        try:
+            orjson.loads(value)
+            return True
+        except orjson.JSONDecodeError:
+            pass
+            
     try:
         json.loads(value)
     except json.JSONDecodeError as e:
-        raise ValidationError(f"Invalid JSON: {str(e)}", field=field)
+        raise ValidationError("Invalid JSON: {}", str(e), field=field)
         
     return True
 
@@ -345,13 +595,22 @@ def validate_uuid(value: str, version: Optional[int] = None, field: Optional[str
         True
     """
     if not isinstance(value, str):
-        raise ValidationError(f"Expected string, got {type(value).__name__}", field=field)
+        raise ValidationError("Expected string, got {}", type(value).__name__, field=field)
+        
+    # Canonical hyphenated form: unless the version is needed, checking the hex
+    # digits is enough and avoids constructing the UUID
+    if version is None and len(value) == 36 and value[8] == value[13] == value[18] == value[23] == '-':
+        try:
+            int(value.replace('-', '', 4), 16)
+        except ValueError:
+            raise ValidationError("Invalid UUID", field=field)
+        return True
         
     try:
         uuid_obj = uuid.UUID(value)
         
         if version is not None and uuid_obj.version != version:
-            raise ValidationError(f"Expected UUID version {version}, got version {uuid_obj.version}", field=field)
+            raise ValidationError("Expected UUID version {}, got version {}", version, uuid_obj.version, field=field)
             
     except ValueError:
         raise ValidationError("Invalid UUID", field=field)
@@ -383,23 +642,29 @@ def validate_not_empty(value: Any, field: Optional[str] = None) -> bool:
     if value is None:
         raise ValidationError("Value cannot be None", field=field)
         
-    if hasattr(value, "__len__") and len(value) == 0:
+    if (isinstance(value, _SIZED_TYPES) or hasattr(value, "__len__")) and len(value) == 0:
         raise ValidationError("Value cannot be empty", field=field)
         
-    if isinstance(value, str) and value.strip() == "":
+    # Empty strings were rejected above; isspace() avoids building a stripped copy
+    if isinstance(value, str) and value.isspace():
         raise ValidationError("Value cannot be empty or whitespace", field=field)
         
     return True
 
 
 # Options validator
-def validate_in_options(value: Any, options: List[Any], field: Optional[str] = None) -> bool:
+def validate_in_options(
+    value: Any, 
+    options: Union[List[Any], Set[Any], FrozenSet[Any]], 
+    field: Optional[str] = None
+) -> bool:
     """
     Validate that a value is one of the allowed options.
     
     Args:
         value: Value to validate
-        options: List of allowed options
+        options: Allowed options. Pass a set or frozenset for constant-time
+            lookups when there are many options.
         field: Field name for error message
         
     Returns:
@@ -412,8 +677,192 @@ def validate_in_options(value: Any, options: List[Any], field: Optional[str] = N
         >>> validate_in_options("red", ["red", "green", "blue"])
         True
     """
-    if value not in options:
-        options_str = ", ".join(str(o) for o in options)
-        raise ValidationError(f"Value must be one of: {options_str}", field=field)
+    try:
+        found = value in options
+    except TypeError:
+        # Unhashable value checked against a set of options
+        found = False
+        
+    if not found:
+        raise ValidationError("Value must be one of: {}", ", ".join(str(o) for o in options), field=field)
+        
+    return True
+
+
+# Batch validation
+def _hyperscan_match_many(database: Any, values: List[Any], scratch: Any = None) -> List[bool]:
+    """
+    Match many values against a Hyperscan database in a single scan.
+    
+    Values are joined with newlines into one buffer; since matches are reported
+    in order of end offset, each one is mapped back to its value by counting
+    the newlines since the previous match. Non-strings and values containing
+    newlines never match. Pass the calling thread's scratch space, since the
+    database's own scratch can't be shared between threads.
+    """
+    results = [False] * len(values)
+    
+    try:
+        text = "\n".join(values)
+    except TypeError:
+        text = None
+        
+    if text is not None and text.count("\n") == len(values) - 1:
+        buffer = text.encode('utf-8', 'surrogatepass')
+    else:
+        buffer = b"\n".join(
+            v.encode('utf-8', 'surrogatepass') if isinstance(v, str) and "\n" not in v else b""
+            for v in values
+        )
         
-    return True
\ No newline at end of file
+    index = 0
+    last_end = 0
+    
+    def on_match(pattern_id, start, end, flags, context):
+        nonlocal index, last_end
+        index += buffer.count(b"\n", last_end, end)
+        last_end = end
+        results[index] = True
+        
+    database.scan(buffer, match_event_handler=on_match, scratch=scratch)
+    return results
+
+
+def _validate_email_many(values: Iterable[Any], field: Optional[str] = None) -> List[bool]:
+    database = _hyperscan_database(_EMAIL_RE)
+    if database is not None:
+        return _hyperscan_match_many(database, list(values), _hyperscan_scratch(database))
+        
+    match = _validate_email_fast if _USE_FAST else _EMAIL_RE.match
+    return [isinstance(v, str) and bool(match(v)) for v in values]
+
+
+def _validate_url_many(values: Iterable[Any], require_https: bool = False, field: Optional[str] = None) -> List[bool]:
+    prefix = "https://" if require_https else ""
+    
+    database = _hyperscan_database(_URL_RE)
+    if database is not None:
+        values = list(values)
+        results = _hyperscan_match_many(database, values, _hyperscan_scratch(database))
+        if require_https:
+            results = [ok and v.startswith(prefix) for ok, v in zip(results, values)]
+        return results
+        
+    match = _validate_url_fast if _USE_FAST else _URL_RE.match
+    return [isinstance(v, str) and bool(match(v)) and v.startswith(prefix) for v in values]
+
+
+def _validate_ip_many(
+    values: Iterable[Any], 
+    allow_ipv4: bool = True, 
+    allow_ipv6: bool = True, 
+    field: Optional[str] = None
+) -> List[bool]:
+    allowed = {0: False, 4: allow_ipv4, 6: allow_ipv6}
+    return [isinstance(v, str) and allowed[_ip_version(v)] for v in values]
+
+
+def _validate_range_many(
+    values: Iterable[Any], 
+    min_value: Optional[Union[int, float]] = None, 
+    max_value: Optional[Union[int, float]] = None, 
+    field: Optional[str] = None
+) -> List[bool]:
+    numeric = (int, float)
+    return [
+        isinstance(v, numeric)
+        and (min_value is None or not v < min_value)
+        and (max_value is None or not v > max_value)
+        for v in values
+    ]
+
+
+# Validators with a dedicated batch implementation
+_BATCH_VALIDATORS = {
+    validate_email: _validate_email_many,
+    validate_url: _validate_url_many,
+    validate_ip: _validate_ip_many,
+    validate_range: _validate_range_many,
+}
+
+
+def validate_many(values: Iterable[Any], validator: Callable[..., bool], **kwargs: Any) -> List[bool]:
+    """
+    Validate many values with the same validator.
+    
+    Built-in validators such as validate_email, validate_url, validate_ip and
+    validate_range use batch implementations that avoid a function call per
+    value; any other validator is called once per value.
+    
+    Args:
+        values: Values to validate
+        validator: Validator function raising ValidationError on failure
+        **kwargs: Extra keyword arguments passed to the validator
+        
+    Returns:
+        List of booleans, True where the corresponding value is valid
+        
+    Example:
+        >>> validate_many(["user@example.com", "invalid"], validate_email)
+        [True, False]
+        >>> validate_many([1, 5, 20], validate_range, min_value=1, max_value=10)
+        [True, True, False]
+    """
+    batch_validator = _BATCH_VALIDATORS.get(validator)
+    if batch_validator is not None:
+        return batch_validator(values, **kwargs)
+        
+    results = []
+    append = results.append
+    for value in values:
+        try:
+            validator(value, **kwargs)
+        except ValidationError:
+            append(False)
+        else:
+            append(True)
+    return results
+
+
+def validate_range_array(
+    values: Any, 
+    min_value: Optional[Union[int, float]] = None, 
+    max_value: Optional[Union[int, float]] = None, 
+    field: Optional[str] = None
+) -> Any:
+    """
+    Check a whole array of numbers against a range at once.
+    
+    Requires NumPy. When Numba is installed, native-endian bool, integer and
+    float32/float64 arrays are checked by a compiled, parallel loop; other
+    dtypes, and bounds that don't fit a machine type, use a NumPy array
+    expression. Lengths can be
+    checked by passing an array of lengths.
+    
+    Args:
+        values: Array-like of numbers
+        min_value: Minimum allowed value (inclusive)
+        max_value: Maximum allowed value (inclusive)
+        field: Field name for error message
+        
+    Returns:
+        NumPy boolean array of the same shape, True where the value is in range
+        
+    Raises:
+        ValidationError if the values are not numeric
+        
+    Example:
+        >>> validate_range_array(np.array([0, 5, 20]), min_value=1, max_value=10)
+        array([False,  True, False])
+    """
+    import numpy as np
+    from . import _kernels
+    
+    array = np.asarray(values)
+    if array.dtype.kind not in "biuf":
+        raise ValidationError("Expected numeric values, got {}", array.dtype, field=field)
+        
+    low = -math.inf if min_value is None else min_value
+    high = math.inf if max_value is None else max_value
+    
+    return _kernels.range_mask(array.ravel(), low, high).reshape(array.shape)
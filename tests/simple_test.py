@@ -9,7 +9,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 def test_validators():
     """Test validators module"""
-    from utils.validation.validators import validate_email, validate_url, ValidationError
+    from utils.validation.validators import validate_email, validate_url, validate_ip, ValidationError
     
     # Test valid cases
     assert validate_email("test@example.com") == True
@@ -22,12 +22,250 @@ def test_validators():
     except ValidationError:
         pass  # Expected
     
+    # IP addresses
+    assert validate_ip("192.168.1.1") == True
+    assert validate_ip("::1") == True
+    for value, kwargs in [("01.2.3.4", {}), ("1.2.3", {}), ("1.2.3.4", {"allow_ipv4": False})]:
+        try:
+            validate_ip(value, **kwargs)
+            assert False, "Should have raised ValidationError"
+        except ValidationError:
+            pass  # Expected
+            
+    # Junk input too long to be an address is not kept in the cache
+    from utils.validation import validators
+    cache_size = validators._cached_ip_version.cache_info().currsize
+    for value in ("1" * 100000, "::" + "1" * 100):
+        try:
+            validate_ip(value)
+            assert False, "Should have raised ValidationError"
+        except ValidationError:
+            pass  # Expected
+    assert validators._cached_ip_version.cache_info().currsize == cache_size
+    
+    # Trailing newlines are not accepted
+    try:
+        validate_email("test@example.com\n")
+        assert False, "Should have raised ValidationError"
+    except ValidationError:
+        pass  # Expected
+    
+    # UUIDs, including the canonical-form fast path
+    from utils.validation.validators import validate_uuid
+    assert validate_uuid("550e8400-e29b-41d4-a716-446655440000") == True
+    assert validate_uuid("550E8400-E29B-41D4-A716-446655440000") == True
+    assert validate_uuid("{550e8400-e29b-41d4-a716-446655440000}") == True
+    assert validate_uuid("550e8400-e29b-41d4-a716-446655440000", version=4) == True
+    for value, kwargs in [
+        ("550e8400-e29b-41d4-a716-44665544000g", {}),
+        ("550e8400-e29b-41d4-a716-4466554400-0", {}),
+        ("550e8400+e29b-41d4-a716-446655440000", {}),
+        ("550e8400-e29b-41d4-a716-446655440000", {"version": 1}),
+    ]:
+        try:
+            validate_uuid(value, **kwargs)
+            assert False, "Should have raised ValidationError"
+        except ValidationError:
+            pass  # Expected
+    
+    # JSON: anything the stdlib accepts is valid, and errors keep its messages
+    from utils.validation.validators import validate_json
+    import json
+    assert validate_json('{"key": [1, 2.5, null]}') == True
+    assert validate_json("NaN") == True
+    assert validate_json('{"value": Infinity}') == True
+    try:
+        validate_json('{"key": }', field="payload")
+        assert False, "Should have raised ValidationError"
+    except ValidationError as e:
+        try:
+            json.loads('{"key": }')
+        except json.JSONDecodeError as stdlib_error:
+            assert str(e) == f"Field 'payload': Invalid JSON: {stdlib_error}"
+    
+    # Range and length bounds
+    from utils.validation.validators import validate_range, validate_length
+    assert validate_range(5, min_value=1, max_value=10) == True
+    assert validate_length("hello", min_length=3, max_length=10) == True
+    for check in (lambda: validate_range(11, 1, 10), lambda: validate_range(0, min_value=1),
+                  lambda: validate_length("hi", 3, 10), lambda: validate_length("hello", max_length=3)):
+        try:
+            check()
+            assert False, "Should have raised ValidationError"
+        except ValidationError:
+            pass  # Expected
+    
+    # Error messages are formatted from a template when read
+    error = ValidationError("Expected {}, got {}", "str", "int", field="name")
+    assert error.message == "Expected str, got int"
+    assert str(error) == "Field 'name': Expected str, got int"
+    assert ValidationError("Literal {braces}").message == "Literal {braces}"
+    assert str(ValidationError("Got {}", "x")) == "Got x"
+    
+    # The old (message, field, details) call shape still works, with a warning
+    import warnings
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        error = ValidationError("Invalid value", "email", {"max": 1})
+        assert (error.message, error.field, error.details) == ("Invalid value", "email", {"max": 1})
+        assert str(ValidationError("Invalid {value}", "email")) == "Field 'email': Invalid {value}"
+    assert [w.category for w in caught] == [DeprecationWarning] * 2
+    
+    # Errors keep their attributes through pickling
+    import pickle
+    error = pickle.loads(pickle.dumps(ValidationError("Max {}", 1, field="email", details={"max": 1})))
+    assert (error.message, error.field, error.details) == ("Max 1", "email", {"max": 1})
+    assert str(error) == "Field 'email': Max 1"
+    
     print("✅ Validators tests passed")
 
+def test_fast_validators():
+    """Test that the scan-based validators agree with the regexes"""
+    from utils.validation import validators
+    
+    emails = ["test@example.com", "a.b+c@d-e.fg", "a@b.c", "@b.co", "a@.co", "a@b@c.co", "a@b.co\n", "é@b.co"]
+    for value in emails:
+        assert validators._validate_email_fast(value) == bool(validators._EMAIL_RE.match(value)), value
+        
+    urls = [
+        "https://example.com", "http://a.example.co/path/x.html?q=1&r=2", "https://-a.com",
+        "ftp://example.com", "https://example.c", "https://example.com:8080", "https://a.com/?x#y",
+    ]
+    for value in urls:
+        assert validators._validate_url_fast(value) == bool(validators._URL_RE.match(value)), value
+        
+    print("✅ Fast validator tests passed")
+
+def test_validate_many():
+    """Test batch validation"""
+    from utils.validation.validators import (
+        validate_many, validate_email, validate_url, validate_ip, validate_range, validate_length
+    )
+    
+    assert validate_many(["test@example.com", "invalid", None], validate_email) == [True, False, False]
+    assert validate_many(["http://a.com", "https://a.com"], validate_url, require_https=True) == [False, True]
+    assert validate_many(["1.2.3.4", "::1", "x"], validate_ip, allow_ipv6=False) == [True, False, False]
+    assert validate_many([0, 5, 11, "5"], validate_range, min_value=1, max_value=10) == [False, True, False, False]
+    assert validate_many(["ab", "abcd"], validate_length, max_length=3) == [True, False]
+    
+    print("✅ Batch validation tests passed")
+
+def test_hyperscan_match_many():
+    """Test mapping of batch scan matches back to values"""
+    from utils.validation import validators
+    import re
+    
+    class StubDatabase:
+        """Stands in for a multiline Hyperscan database, reporting matches in end order"""
+        
+        def __init__(self, pattern):
+            self.regex = re.compile(pattern.pattern[:-2].encode('ascii') + b'$', re.MULTILINE)
+            
+        def scan(self, buffer, match_event_handler, scratch=None):
+            for match in self.regex.finditer(buffer):
+                match_event_handler(0, match.start(), match.end(), 0, None)
+                
+    database = StubDatabase(validators._EMAIL_RE)
+    values = [
+        "a@b.co", "", "invalid", "é@b.co", "x\na@b.co", None, "c@d.org", "a@b.co\n", "é", "e@f.net",
+    ]
+    expected = [True, False, False, False, False, False, True, False, False, True]
+    assert validators._hyperscan_match_many(database, values) == expected
+    assert validators._hyperscan_match_many(database, ["a@b.co", "é", "c@d.org"]) == [True, False, True]
+    assert validators._hyperscan_match_many(database, []) == []
+    
+    if validators.hyperscan is None:
+        print("⏭️  Hyperscan database tests skipped (hyperscan not installed)")
+    else:
+        # The real databases agree with the regexes, also when scanned from
+        # several threads at once
+        import threading
+        values = values + [
+            "http://a.com/x?y=1", "https://ex.co/p#f", "http://9a.bc", "http://-a.com",
+            "ftp://a.com", "a@b.c", "a@@b.co", "a b@c.de", "https://a.co/ü", None, 5,
+        ] * 500
+        expected = [
+            [isinstance(v, str) and bool(regex.match(v)) for v in values]
+            for regex in (validators._EMAIL_RE, validators._URL_RE)
+        ]
+        failures = []
+        
+        def check():
+            try:
+                for _ in range(50):
+                    results = [validators._validate_email_many(values), validators._validate_url_many(values)]
+                    assert results == expected
+            except Exception as e:
+                failures.append(e)
+                    
+        threads = [threading.Thread(target=check) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not failures, failures
+        
+    print("✅ Hyperscan match mapping tests passed")
+
+def test_validate_range_array():
+    """Test array range validation (requires NumPy)"""
+    try:
+        import numpy as np
+    except ImportError:
+        print("⏭️  Array validation tests skipped (NumPy not installed)")
+        return
+        
+    from utils.validation.validators import validate_range_array, ValidationError
+    
+    mask = validate_range_array(np.array([0, 5, 20, 10]), min_value=1, max_value=10)
+    assert mask.tolist() == [False, True, False, True]
+    assert validate_range_array([[1.5, 3.0]], max_value=2).tolist() == [[True, False]]
+    
+    try:
+        validate_range_array(np.array(["a"]), min_value=1)
+        assert False, "Should have raised ValidationError"
+    except ValidationError:
+        pass  # Expected
+        
+    # The compiled kernel (if Numba is installed) agrees with the NumPy one,
+    # including bool/int/float arrays against float bounds and NaN; dtypes
+    # and bounds Numba can't handle are routed to NumPy
+    from utils.validation import _kernels
+    arrays = [
+        np.array([True, False]),
+        np.array([-5, 0, 3, 2 ** 40], dtype=np.int64),
+        np.array([0, 7, 255], dtype=np.uint8),
+        np.array([0, 2 ** 62 + 2, 2 ** 64 - 1], dtype=np.uint64),
+        np.array([-np.inf, -1.5, 0.0, np.nan, 2.5, np.inf]),
+        np.array([-1.5, 0.0, 2.5], dtype=np.float16),
+        np.array([-1.5, 0.0, 2.5], dtype=np.longdouble),
+        np.array([-1.5, 0.0, 2.5], dtype=">f8"),
+        np.array([-5, 0, 3], dtype=">i4"),
+        np.array([-5, 0, 3], dtype=np.int8),
+    ]
+    bounds = [
+        (-np.inf, np.inf), (0, 3), (-1.5, np.inf), (-np.inf, 2.5), (0.5, 1.5),
+        (-1, 2 ** 62 + 1), (1.5, 2 ** 70), (-2 ** 70, 0),
+    ]
+    for array in arrays:
+        for low, high in bounds:
+            if array.dtype == np.bool_ and max(abs(low), abs(high)) == 2 ** 70:
+                continue  # NumPy itself can't compare bools with huge ints
+            with np.errstate(over="ignore"):
+                expected = _kernels._range_mask_numpy(array, low, high)
+                assert _kernels.range_mask(array, low, high).tolist() == expected.tolist()
+                mask = validate_range_array(array, min_value=low, max_value=high)
+                assert mask.tolist() == expected.tolist()
+    assert validate_range_array(np.array([np.nan, 0.0]), min_value=1).tolist() == [True, False]
+    assert validate_range_array(np.array([True, False]), min_value=1).tolist() == [True, False]
+    print("✅ Array validation tests passed")
+
 def test_json_converter():
     """Test JSON converter module"""
     from utils.conversion.json_converter import to_json, from_json
+    import dataclasses
     import datetime
+    import json
     
     # Test with datetime
     data = {"name": "test", "date": datetime.datetime.now()}
@@ -41,8 +279,102 @@ def test_json_converter():
     parsed = from_json(json_str)
     assert parsed["key"] == "value"
     
+    # Integers wider than 64 bits keep full precision
+    assert from_json("123456789012345678901234567890") == 123456789012345678901234567890
+    assert from_json(b'{"n": -9223372036854775809}') == {"n": -9223372036854775809}
+    
+    # Bytes-like input
+    for raw in (b'{"key": "value"}', bytearray(b'{"key": "value"}'), memoryview(b'{"key": "value"}')):
+        assert from_json(raw) == simple_data
+    assert from_json(b'{invalid') == {}
+    assert from_json(b'\xff') == {}
+    assert from_json(b'"\xc3"') == {}
+    try:
+        from_json(b'\xff', strict=True)
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert str(e).startswith("Invalid JSON")
+    
+    # Non-ASCII output is escaped unless ensure_ascii=False
+    assert to_json({"name": "café"}) == '{"name":"caf\\u00e9"}'
+    assert to_json({"a": [1, 2]}) == '{"a":[1,2]}'
+    assert to_json({"a": float("nan")}) == '{"a":NaN}'
+    assert from_json(to_json({"name": "café"}, ensure_ascii=False))["name"] == "café"
+    
+    # Values outside the fast path still serialize
+    assert str(2 ** 70 + 1) in to_json({"big": 2 ** 70 + 1})
+    
+    # Output is the same with or without orjson
+    assert to_json(float("nan")) == "NaN"
+    assert json.loads(to_json({"a": float("inf"), "b": None})) == {"a": float("inf"), "b": None}
+    
+    @dataclasses.dataclass
+    class Point:
+        x: int
+        
+        def to_json(self):
+            return {"custom": self.x}
+            
+    assert json.loads(to_json(Point(1))) == {"custom": 1}
+    
+    # Bytes output
+    json_bytes = to_json(simple_data, as_bytes=True)
+    assert isinstance(json_bytes, bytes)
+    assert from_json(json_bytes.decode('utf-8')) == simple_data
+    
     print("✅ JSON converter tests passed")
 
+def test_json_files():
+    """Test JSON file round trip"""
+    from utils.conversion.json_converter import json_to_file, json_from_file
+    import tempfile
+    
+    data = {"name": "café", "items": list(range(1000))}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = os.path.join(tmpdir, "data.json")
+        json_to_file(data, filepath)
+        assert json_from_file(filepath) == data
+        
+        json_to_file(data, filepath, pretty=False, ensure_ascii=False)
+        assert json_from_file(filepath) == data
+        
+    assert json_from_file(os.path.join(tmpdir, "missing.json")) == {}
+    
+    print("✅ JSON file tests passed")
+
+def test_merge_json():
+    """Test JSON merging"""
+    from utils.conversion.json_converter import merge_json
+    
+    base = {"a": {"x": 1, "z": {"q": 1}}, "b": 1}
+    update = {"a": {"y": 2, "z": {"r": 2}}, "b": {"c": 1}}
+    assert merge_json(base, update) == {"a": {"x": 1, "y": 2, "z": {"q": 1, "r": 2}}, "b": {"c": 1}}
+    assert merge_json('{"a": {"x": 1}}', '{"a": {"y": 2}}') == {"a": {"x": 1, "y": 2}}
+    assert merge_json({"a": {"x": 1}}, {"a": {"y": 2}}, deep=False) == {"a": {"y": 2}}
+    
+    # Only inplace=True modifies the base dict
+    base = {"a": 1}
+    assert merge_json(base, {"b": 2}) == {"a": 1, "b": 2}
+    assert base == {"a": 1}
+    assert merge_json(base, {"b": 2}, inplace=True) is base
+    assert base == {"a": 1, "b": 2}
+    
+    # Deep merges leave nested dicts of both inputs untouched and unshared
+    base = {"a": {"x": 1}}
+    update = {"a": {"y": 2}, "b": {"c": {"d": 1}}}
+    merged = merge_json(base, update)
+    assert merged == {"a": {"x": 1, "y": 2}, "b": {"c": {"d": 1}}}
+    assert base == {"a": {"x": 1}}
+    merged["b"]["c"]["d"] = 2
+    assert update == {"a": {"y": 2}, "b": {"c": {"d": 1}}}
+    
+    # In place, nested dicts of base are merged into directly
+    nested = base["a"]
+    merge_json(base, {"a": {"y": 2}}, inplace=True)
+    assert nested == {"x": 1, "y": 2}
+    
+    print("✅ Merge JSON tests passed")
+
 def test_imports():
     """Test that all imports work correctly"""
     from utils import validate_email, to_json, ValidationError
@@ -52,12 +384,24 @@ def test_imports():
     assert callable(to_json)
     assert issubclass(ValidationError, Exception)
     
+    # Importing the package alone does not load the submodules
+    import subprocess
+    code = "import sys, utils; assert 'utils.validation.validators' not in sys.modules"
+    src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
+    subprocess.run([sys.executable, "-c", code], check=True, env=dict(os.environ, PYTHONPATH=src_dir))
+    
     print("✅ Import tests passed")
 
 if __name__ == "__main__":
     try:
         test_validators()
+        test_fast_validators()
+        test_validate_many()
+        test_hyperscan_match_many()
+        test_validate_range_array()
         test_json_converter()
+        test_json_files()
+        test_merge_json()
         test_imports()
         print("\n🎉 All tests passed!")
     except Exception as e: